@@ -0,0 +1,289 @@
+"""Compile CQL2 ASTs (as parsed by pygeofilter) into functions that evaluate
+the filter against a dataframe.
+
+pygeofilter's geopandas backend walks the AST on every evaluation and wraps
+every intermediate result in a pandas Series. Here the AST is walked once and
+turned into nested closures that work on the column arrays directly. Nodes that
+are not supported are evaluated with pygeofilter as before.
+
+If numba is installed, filters that only compare numeric columns to numeric
+literals are additionally lowered to a single jitted loop over the columns,
+which is used for frames with at least ``KERNEL_MIN_ROWS`` rows.
+"""
+import importlib.util
+import operator
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Callable, Optional, Union
+
+import numpy as np
+import pandas as pd
+from pygeofilter import ast
+from pygeofilter.backends.geopandas.evaluate import to_filter
+from pygeofilter.util import like_pattern_to_re
+
+# numba is only imported once a kernel is actually needed
+HAS_NUMBA = importlib.util.find_spec("numba") is not None
+
+# Below this many rows the closures are fast enough that jitting a kernel
+# (about 0.1 s for each new filter) doesn't pay off.
+KERNEL_MIN_ROWS = 1_000_000
+
+Compiled = Callable[[pd.DataFrame], np.ndarray]
+
+FUNCTION_MAP = {"sin": np.sin}
+
+COMPARISON_OPS = {
+    "=": operator.eq,
+    "<>": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+ARITHMETIC_OPS = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv,
+}
+
+LITERALS = (str, float, int, bool, datetime)
+
+
+class Unsupported(Exception):
+    """Raised when part of an AST cannot be compiled"""
+
+
+def _column(
+    df: pd.DataFrame, name: str, decode: bool = False
+) -> Union[np.ndarray, pd.Series]:
+    """Get a column as a numpy array when it has a plain numeric dtype, so
+    that comparisons skip pandas. Anything else (strings, nullable and
+    timezone aware dtypes) stays a Series to keep pandas semantics.
+
+    With ``decode``, categoricals are converted to the dtype of their
+    categories, since unordered categoricals only support ``=`` and ``<>``.
+    """
+    column = df[name]
+    if decode and isinstance(column.dtype, pd.CategoricalDtype):
+        column = column.astype(column.cat.categories.dtype)
+    if isinstance(column.dtype, np.dtype) and column.dtype.kind in "biuf":
+        return column.to_numpy()
+    return column
+
+
+def _to_mask(result: Any, n: int) -> np.ndarray:
+    if isinstance(result, pd.Series):
+        return result.to_numpy(dtype=bool, na_value=False)
+    if np.ndim(result) == 0:
+        return np.full(n, bool(result))
+    return np.asarray(result, dtype=bool)
+
+
+def _compile_value(node, decode: bool = False) -> Callable[[pd.DataFrame], Any]:
+    """``decode`` is passed on to :func:`_column` for attributes."""
+    if isinstance(node, ast.Attribute):
+        name = node.name
+        return lambda df: _column(df, name, decode)
+
+    if isinstance(node, ast.Arithmetic):
+        op = ARITHMETIC_OPS[node.op.value]
+        lhs = _compile_value(node.lhs, decode=True)
+        rhs = _compile_value(node.rhs, decode=True)
+        return lambda df: op(lhs(df), rhs(df))
+
+    if isinstance(node, LITERALS):
+        return lambda df: node
+
+    raise Unsupported(node)
+
+
+def _compile_predicate(node) -> Compiled:
+    if isinstance(node, ast.Not):
+        sub = _compile_predicate(node.sub_node)
+        return lambda df: ~sub(df)
+
+    if isinstance(node, (ast.And, ast.Or)):
+        op = operator.and_ if isinstance(node, ast.And) else operator.or_
+        lhs, rhs = _compile_predicate(node.lhs), _compile_predicate(node.rhs)
+        return lambda df: op(lhs(df), rhs(df))
+
+    try:
+        compiled = _compile_comparison(node)
+    except Unsupported:
+        # evaluate just this node with pygeofilter
+        return lambda df: _to_mask(to_filter(df, node, {}, FUNCTION_MAP), len(df))
+
+    def predicate(df: pd.DataFrame) -> np.ndarray:
+        result = _to_mask(compiled(df), len(df))
+        if getattr(node, "not_", False):
+            result = ~result
+        return result
+
+    return predicate
+
+
+def _compile_comparison(node) -> Callable[[pd.DataFrame], Any]:
+    if isinstance(node, ast.Comparison):
+        op = COMPARISON_OPS[node.op.value]
+        decode = node.op.value not in ("=", "<>")
+        lhs = _compile_value(node.lhs, decode)
+        rhs = _compile_value(node.rhs, decode)
+        return lambda df: op(lhs(df), rhs(df))
+
+    if isinstance(node, ast.Between):
+        lhs = _compile_value(node.lhs, decode=True)
+        low = _compile_value(node.low, decode=True)
+        high = _compile_value(node.high, decode=True)
+
+        def between(df):
+            values = lhs(df)
+            return (values >= low(df)) & (values <= high(df))
+
+        return between
+
+    if isinstance(node, ast.In):
+        lhs = _compile_value(node.lhs)
+        if not all(isinstance(option, LITERALS) for option in node.sub_nodes):
+            raise Unsupported(node)
+        options = list(node.sub_nodes)
+
+        def isin(df):
+            values = lhs(df)
+            if isinstance(values, pd.Series):
+                return values.isin(options)
+            return np.isin(values, options)
+
+        return isin
+
+    if isinstance(node, ast.IsNull):
+        lhs = _compile_value(node.lhs)
+        return lambda df: pd.isna(lhs(df))
+
+    if isinstance(node, ast.Like):
+        if not isinstance(node.lhs, ast.Attribute):
+            raise Unsupported(node)
+        name = node.lhs.name
+        regex = like_pattern_to_re(
+            node.pattern,
+            node.nocase,
+            node.wildcard,
+            node.singlechar,
+            node.escapechar or "\\",
+        )
+        return lambda df: df[name].str.match(regex)
+
+    raise Unsupported(node)
+
+
+NUMERIC_LITERALS = (float, int, bool)
+
+KERNEL_OPS = {"=": "==", "<>": "!=", "<": "<", "<=": "<=", ">": ">", ">=": ">="}
+
+KERNEL_TEMPLATE = """
+def kernel({args}):
+    out = np.empty(c0.shape[0], np.bool_)
+    for i in range(c0.shape[0]):
+        out[i] = {expr}
+    return out
+"""
+
+
+class _KernelBuilder:
+    """Turn a numeric-only AST into the source of a loop over the columns.
+
+    Columns and literals become arguments of the kernel so that filters which
+    only differ in their literals share one jitted function.
+    """
+
+    def __init__(self):
+        self.columns: list[str] = []
+        self.literals: list[Any] = []
+
+    def value(self, node) -> str:
+        if isinstance(node, ast.Attribute):
+            if node.name not in self.columns:
+                self.columns.append(node.name)
+            return f"c{self.columns.index(node.name)}[i]"
+        if isinstance(node, ast.Arithmetic):
+            return f"({self.value(node.lhs)} {node.op.value} {self.value(node.rhs)})"
+        if isinstance(node, NUMERIC_LITERALS):
+            self.literals.append(node)
+            return f"l{len(self.literals) - 1}"
+        raise Unsupported(node)
+
+    def predicate(self, node) -> str:
+        if isinstance(node, ast.Not):
+            return f"(not {self.predicate(node.sub_node)})"
+        if isinstance(node, ast.And):
+            return f"({self.predicate(node.lhs)} and {self.predicate(node.rhs)})"
+        if isinstance(node, ast.Or):
+            return f"({self.predicate(node.lhs)} or {self.predicate(node.rhs)})"
+        if isinstance(node, ast.Comparison):
+            op = KERNEL_OPS[node.op.value]
+            return f"({self.value(node.lhs)} {op} {self.value(node.rhs)})"
+        if isinstance(node, ast.Between):
+            lhs, low, high = map(self.value, (node.lhs, node.low, node.high))
+            expr = f"({lhs} >= {low} and {lhs} <= {high})"
+            return f"(not {expr})" if node.not_ else expr
+        raise Unsupported(node)
+
+    def source(self, root) -> str:
+        expr = self.predicate(root)
+        if not self.columns:
+            raise Unsupported(root)
+        args = [f"c{i}" for i in range(len(self.columns))]
+        args += [f"l{i}" for i in range(len(self.literals))]
+        return KERNEL_TEMPLATE.format(args=", ".join(args), expr=expr)
+
+
+@lru_cache(maxsize=256)
+def _jit(source: str) -> Callable:
+    import numba
+
+    namespace: dict[str, Any] = {"np": np}
+    exec(source, namespace)
+    return numba.njit(error_model="numpy")(namespace["kernel"])
+
+
+def _compile_kernel(root) -> Optional[Callable[[pd.DataFrame], Optional[np.ndarray]]]:
+    """Compile a filter on numeric columns with numba. The returned function
+    gives None when a column turns out not to have a plain numeric dtype.
+    """
+    builder = _KernelBuilder()
+    try:
+        source = builder.source(root)
+    except Unsupported:
+        return None
+    columns, literals = builder.columns, builder.literals
+
+    def evaluate(df: pd.DataFrame) -> Optional[np.ndarray]:
+        arrays = [_column(df, name) for name in columns]
+        if not all(isinstance(array, np.ndarray) for array in arrays):
+            return None
+        return _jit(source)(*arrays, *literals)
+
+    return evaluate
+
+
+def compile_ast(root) -> Compiled:
+    """Compile a CQL2 AST into a function that takes a dataframe and returns
+    a boolean numpy array with one entry per row, True where the row matches.
+
+    A comparison with a null value is False, as in pygeofilter's geopandas
+    backend, so rows with nulls don't match ``view:azimuth < 200`` but do
+    match ``NOT (view:azimuth < 200)``.
+    """
+    predicate = _compile_predicate(root)
+    kernel = _compile_kernel(root) if HAS_NUMBA else None
+
+    def evaluate(df: pd.DataFrame) -> np.ndarray:
+        if kernel is not None and len(df) >= KERNEL_MIN_ROWS:
+            result = kernel(df)
+            if result is not None:
+                return result
+        return _to_mask(predicate(df), len(df))
+
+    return evaluate
@@ -1,9 +1,13 @@
+import copy
 import json
+import os
+import re
 from collections.abc import Iterator
-from copy import deepcopy
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime as datetime_
 from enum import Enum
-from functools import cache, cached_property
+from functools import cache, cached_property, lru_cache
+from itertools import repeat
 from typing import (
     Any,
     Optional,
@@ -14,13 +18,20 @@ from typing import (
 import geopandas
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 import pystac
 import shapely
-import stac_geoparquet
-from pygeofilter.backends.geopandas.evaluate import to_filter
 from pygeofilter.parsers import cql2_json, cql2_text
 
-from stac_static.utils import to_geodataframe
+from stac_static.cql2 import Compiled, compile_ast
+from stac_static.utils import (
+    _cached_geodataframe,
+    from_geoparquet,
+    read_geoparquet_cached,
+    to_item_dicts,
+)
 
 
 class Parsers(Enum):
@@ -34,7 +45,8 @@ class GeoInterface(Protocol):
         ...
 
 
-CatalogLike = Union[pystac.Catalog, geopandas.GeoDataFrame]
+PathLike = Union[str, os.PathLike]
+CatalogLike = Union[pystac.Catalog, geopandas.GeoDataFrame, PathLike]
 
 DatetimeOrTimestamp = Optional[Union[datetime_, str, pd.Timestamp]]
 Datetime = tuple[pd.Timestamp, pd.Timestamp]
@@ -61,40 +73,362 @@ def search(catalog: CatalogLike, **params):
     return ItemSearch(catalog, **params)
 
 
-def _search(df: geopandas.GeoDataFrame, **params):
-    subset = df.copy()
+@lru_cache(maxsize=256)
+def _parse_filter(lang: str, expr: str):
+    """Parse a filter expression, caching the AST for repeated filters."""
+    parse = getattr(Parsers, lang.replace("-", "_"))
+    return parse(expr)
+
+
+@lru_cache(maxsize=256)
+def _compile_filter(lang: str, expr: str) -> Compiled:
+    """Compile a filter expression, caching the result for repeated filters."""
+    return compile_ast(_parse_filter(lang, expr))
+
+
+def _filter_expr(_filter: FilterLike) -> str:
+    """Dict filters are normalized to a sorted JSON string so that they can
+    be used as a cache key.
+    """
+    if isinstance(_filter, dict):
+        return json.dumps(_filter, sort_keys=True)
+    return _filter
+
+
+def _compiled_filter(_filter: FilterLike, lang: str) -> Compiled:
+    """Get the (cached) compiled version of a filter."""
+    return _compile_filter(lang, _filter_expr(_filter))
+
+
+# RFC 3339 date-times (upper-cased) and the truncated forms ("2017",
+# "2017-08", "2017-08-31T17") that are read as the whole year, month, hour...
+DATETIME_RE = re.compile(
+    r"^\d{4}(?P<month>-\d{2})?(?P<day>-\d{2})?"
+    r"(?:[T ](?P<hour>\d{2})(?P<minute>:\d{2})?(?P<second>:\d{2})?"
+    r"(?:\.(?P<fraction>\d{1,9}))?)?"
+    r"(?:Z|[+-]\d{2}:?\d{2})?$"
+)
+
+
+def _datetime_span(value: str) -> Union[pd.DateOffset, pd.Timedelta]:
+    """How much time an upper-cased datetime string covers, based on how
+    precisely it is written. Fractions of a second cover a millisecond,
+    microsecond or nanosecond depending on the number of digits.
+    """
+    match = DATETIME_RE.match(value)
+    if match is None:
+        raise ValueError(f"invalid datetime: {value!r}, expected RFC 3339")
+    if match["fraction"]:
+        digits = -(-len(match["fraction"]) // 3) * 3
+        return pd.Timedelta(10 ** (9 - digits), "ns")
+    for unit, span in [
+        ("second", pd.Timedelta(seconds=1)),
+        ("minute", pd.Timedelta(minutes=1)),
+        ("hour", pd.Timedelta(hours=1)),
+        ("day", pd.Timedelta(days=1)),
+        ("month", pd.offsets.MonthBegin(1)),
+    ]:
+        if match[unit]:
+            return span
+    return pd.offsets.YearBegin(1)
+
+
+def _datetime_bounds(
+    components: list[DatetimeOrTimestamp],
+) -> list[Optional[Datetime]]:
+    """Start and end of the time covered by each component, or None for
+    open ("..") components. Strings cover the whole period they specify,
+    datetime objects a single instant. All the components are parsed in one
+    call.
+    """
+    components = [c.upper() if isinstance(c, str) else c for c in components]
+    spans = [
+        _datetime_span(c) if isinstance(c, str) and c != ".." else None
+        for c in components
+    ]
+    closed = [c for c in components if c != ".."]
+    starts = iter(pd.to_datetime(closed, utc=True, format="ISO8601", cache=True))
+    bounds: list[Optional[Datetime]] = []
+    for component, span in zip(components, spans):
+        if component == "..":
+            bounds.append(None)
+            continue
+        start = next(starts)
+        end = start if span is None else start + span - pd.Timedelta(1, "ns")
+        bounds.append((start, end))
+    return bounds
+
+
+# Below this many rows it is cheaper to compare bounding boxes directly than
+# to build a spatial index.
+SINDEX_MIN_ROWS = 5_000
+
+
+# When the other parameters leave at most this fraction of the rows, the
+# filter is only evaluated on those rows.
+FILTER_SUBSET_FRACTION = 0.25
+
+
+def _bounds(df: geopandas.GeoDataFrame) -> np.ndarray:
+    """Bounds of every geometry as a (4, N) array with contiguous
+    minx, miny, maxx, maxy rows.
+    """
+    return np.ascontiguousarray(df.geometry.bounds.to_numpy().T)
+
+
+# Refining at least this many candidates with GEOS is split across threads.
+# GEOS releases the GIL so the chunks run in parallel.
+PARALLEL_MIN_CANDIDATES = 1_000_000
+
+
+def _prepared(
+    shape: shapely.geometry.base.BaseGeometry,
+) -> shapely.geometry.base.BaseGeometry:
+    """A prepared copy of ``shape``, which may belong to the caller and so
+    is not prepared in place.
+    """
+    prepared = copy.copy(shape)
+    shapely.prepare(prepared)
+    return prepared
+
+
+def _intersects_prepared(shape, geometries: np.ndarray) -> np.ndarray:
+    return shapely.intersects(_prepared(shape), geometries)
+
+
+def _refine(geometries: np.ndarray, shape: shapely.geometry.base.BaseGeometry):
+    """``shapely.intersects(shape, geometries)`` against a prepared copy of
+    ``shape``, chunked over one thread per core when there are at least
+    ``PARALLEL_MIN_CANDIDATES`` geometries. Each thread prepares its own
+    copy, since GEOS builds the prepared indexes lazily.
+    """
+    workers = os.cpu_count() or 1
+    if len(geometries) < PARALLEL_MIN_CANDIDATES or workers == 1:
+        return _intersects_prepared(shape, geometries)
+    chunks = np.array_split(geometries, workers)
+    with ThreadPoolExecutor(workers) as pool:
+        return np.concatenate(
+            list(pool.map(_intersects_prepared, repeat(shape), chunks))
+        )
+
+
+def _intersects(
+    df: geopandas.GeoDataFrame,
+    shape: shapely.geometry.base.BaseGeometry,
+    bounds: np.ndarray,
+    candidates: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Rows of ``df`` among ``candidates`` (all rows if None) whose geometry
+    intersects ``shape``.
+
+    Bounding boxes are compared first so that GEOS only sees the rows that
+    can possibly intersect.
+    """
+    minx, miny, maxx, maxy = bounds
+    qminx, qminy, qmaxx, qmaxy = shape.bounds
+    hit = (maxx >= qminx) & (minx <= qmaxx) & (maxy >= qminy) & (miny <= qmaxy)
+    if candidates is not None:
+        hit &= candidates
+    idx = np.flatnonzero(hit)
+    hit[idx] = _refine(np.asarray(df.geometry.values)[idx], shape)
+    return hit
+
+
+def _sorted_datetimes(df: geopandas.GeoDataFrame) -> Optional[np.ndarray]:
+    """``datetime`` column of ``df`` as datetime64[ns] (UTC) if it is sorted,
+    otherwise None. Also None unless the column is a numpy backed timezone
+    aware datetime (not object or Arrow backed), which are only compared row
+    by row.
+    """
+    if "datetime" not in df:
+        return None
+    datetimes = df["datetime"]
+    if not isinstance(datetimes.dtype, pd.DatetimeTZDtype):
+        return None
+    if not datetimes.is_monotonic_increasing:
+        return None
+    return datetimes.values.astype("datetime64[ns]", copy=False)
+
+
+def _and(mask: Optional[np.ndarray], other: np.ndarray) -> np.ndarray:
+    """AND ``other`` into ``mask`` in place, starting a new mask if needed."""
+    if mask is None:
+        return np.array(other, dtype=bool)
+    mask &= other
+    return mask
+
+
+def _search_mask(
+    df: geopandas.GeoDataFrame,
+    compiled_filter: Optional[Compiled] = None,
+    sindex=None,
+    bounds: Optional[np.ndarray] = None,
+    sorted_datetimes: Optional[np.ndarray] = None,
+    bbox_geom: Optional[shapely.geometry.base.BaseGeometry] = None,
+    intersects_geom: Optional[shapely.geometry.base.BaseGeometry] = None,
+    **params,
+) -> Optional[np.ndarray]:
+    """Boolean array with one entry per row of ``df``, True where the row
+    matches all of the search parameters.
+
+    Frames with fewer than ``SINDEX_MIN_ROWS`` rows and no spatial index yet
+    are searched spatially by comparing against the bounds of each geometry
+    (``bounds``, see :func:`_bounds`) before refining with GEOS.
+
+    If ``sorted_datetimes`` is provided it must be the ``datetime`` column of
+    ``df`` as a monotonic increasing ``datetime64[ns]`` array (UTC).
+    ``bbox_geom`` and ``intersects_geom`` are the shapely versions of the
+    ``bbox`` and ``intersects`` parameters (built here if not provided) and
+    ``compiled_filter`` the compiled version of ``filter`` (see
+    :func:`stac_static.cql2.compile_ast`).
+
+    Predicates are ANDed into the mask in place, cheapest first. Returns None
+    if there are no predicates at all (every row matches), and stops early
+    once no rows are left. The filter is evaluated only on the rows that are
+    left when there are few of them (see ``FILTER_SUBSET_FRACTION``).
+    """
+    mask: Optional[np.ndarray] = None
 
     if "ids" in params:
-        ids = params["ids"]
-        subset = subset[subset["id"].isin(ids)]
+        ids = tuple(params["ids"])
+        mask = _and(mask, df["id"].isin(ids).to_numpy(copy=False))
 
     if "collections" in params:
-        collections = params["collections"]
-        subset = subset[subset["collection"].isin(collections)]
+        collections = tuple(params["collections"])
+        mask = _and(mask, df["collection"].isin(collections).to_numpy(copy=False))
 
-    if "bbox" in params:
-        bbox = params["bbox"]
-        bbox_shape = shapely.geometry.box(*bbox)
-        subset = subset[subset.geometry.intersects(bbox_shape)]
+    if "datetime" in params:
+        start, end = params["datetime"]
+        if sorted_datetimes is not None:
+            lo, hi = 0, len(df)
+            if start is not None:
+                lo = np.searchsorted(sorted_datetimes, start.to_datetime64(), "left")
+            if end is not None:
+                hi = np.searchsorted(sorted_datetimes, end.to_datetime64(), "right")
+            window = np.zeros(len(df), dtype=bool)
+            window[lo:hi] = True
+            mask = _and(mask, window)
+        else:
+            if start is not None:
+                mask = _and(mask, (df.datetime >= start).to_numpy(copy=False))
+            if end is not None:
+                mask = _and(mask, (df.datetime <= end).to_numpy(copy=False))
+
+    if mask is not None and not mask.any():
+        return mask
+
+    if "bbox" in params or "intersects" in params:
+        shapes = []
+        if "bbox" in params:
+            if bbox_geom is None:
+                bbox_geom = shapely.geometry.box(*params["bbox"])
+            shapes.append(bbox_geom)
+        if "intersects" in params:
+            if intersects_geom is None:
+                intersects_geom = shapely.geometry.shape(params["intersects"])
+            shapes.append(intersects_geom)
+
+        if sindex is None and (df.has_sindex or len(df) >= SINDEX_MIN_ROWS):
+            sindex = df.sindex
+
+        for shape in shapes:
+            if sindex is not None:
+                idx = sindex.query(shape)
+                if mask is not None:
+                    idx = idx[mask[idx]]
+                idx = idx[_refine(np.asarray(df.geometry.values)[idx], shape)]
+                spatial = np.zeros(len(df), dtype=bool)
+                spatial[idx] = True
+                mask = _and(mask, spatial)
+            else:
+                if bounds is None:
+                    bounds = _bounds(df)
+                mask = _and(mask, _intersects(df, shape, bounds, mask))
 
-    if "intersects" in params:
-        intersects = params["intersects"]
-        intersects_shape = shapely.geometry.shape(intersects)
-        subset = subset[subset.geometry.intersects(intersects_shape)]
+        if not mask.any():
+            return mask
 
     if "filter" in params:
-        parse = getattr(Parsers, params["filter-lang"].replace("-", "_"))
-        ast = parse(params["filter"])
-        subset = subset[to_filter(subset, ast, {}, {"sin": np.sin})]
+        if compiled_filter is None:
+            compiled_filter = _compiled_filter(params["filter"], params["filter-lang"])
+        if mask is not None and mask.sum() <= len(df) * FILTER_SUBSET_FRACTION:
+            idx = np.flatnonzero(mask)
+            mask[idx] = compiled_filter(df.iloc[idx])
+        else:
+            mask = _and(mask, compiled_filter(df))
 
-    if "datetime" in params:
+    return mask
+
+
+def _parquet_filter(
+    schema: pa.Schema,
+    bbox_geom: Optional[shapely.geometry.base.BaseGeometry] = None,
+    intersects_geom: Optional[shapely.geometry.base.BaseGeometry] = None,
+    **params,
+) -> Optional[pc.Expression]:
+    """Translate the search parameters into a pyarrow filter expression that
+    can be pushed down into a parquet scan, so that row groups whose
+    statistics rule them out are never decoded.
+
+    The expression is a superset of the search: bbox and intersects only
+    compare bounding boxes (and only when the file has a GeoParquet ``bbox``
+    struct column) and the filter parameter is not translated at all.
+    """
+    names = schema.names
+    exprs = []
+
+    if "ids" in params and "id" in names:
+        exprs.append(pc.field("id").isin(list(params["ids"])))
+
+    if "collections" in params and "collection" in names:
+        exprs.append(pc.field("collection").isin(list(params["collections"])))
+
+    if "datetime" in params and "datetime" in names:
         start, end = params["datetime"]
+        dtype = schema.field("datetime").type
+        # pa.scalar(pd.Timestamp) would truncate to microseconds
+        ns = pa.timestamp("ns", tz="UTC")
         if start is not None:
-            subset = subset[subset.datetime >= start]
+            lo = pa.scalar(start.value, ns).cast(dtype, False)
+            exprs.append(pc.field("datetime") >= lo)
         if end is not None:
-            subset = subset[subset.datetime <= end]
+            hi = pa.scalar(end.value, ns).cast(dtype, False)
+            exprs.append(pc.field("datetime") <= hi)
+
+    if "bbox" in names and pa.types.is_struct(schema.field("bbox").type):
+        bounds = []
+        if "bbox" in params:
+            if bbox_geom is None:
+                bbox_geom = shapely.geometry.box(*params["bbox"])
+            bounds.append(bbox_geom.bounds)
+        if "intersects" in params:
+            if intersects_geom is None:
+                intersects_geom = shapely.geometry.shape(params["intersects"])
+            bounds.append(intersects_geom.bounds)
+        for minx, miny, maxx, maxy in bounds:
+            exprs.extend(
+                [
+                    pc.field("bbox", "xmax") >= minx,
+                    pc.field("bbox", "xmin") <= maxx,
+                    pc.field("bbox", "ymax") >= miny,
+                    pc.field("bbox", "ymin") <= maxy,
+                ]
+            )
 
-    return subset
+    if not exprs:
+        return None
+
+    expr = exprs[0]
+    for e in exprs[1:]:
+        expr = expr & e
+    return expr
+
+
+def _search(df: geopandas.GeoDataFrame, **params):
+    mask = _search_mask(df, **params)
+    if mask is None:
+        return df
+    return df.iloc[np.flatnonzero(mask)]
 
 
 class ItemSearch:
@@ -110,7 +444,9 @@ class ItemSearch:
 
     Args:
         catalog : pystac.Catalog object or geopandas.GeoDataFrame representation of STAC
-            items
+            items or a path to a GeoParquet file of STAC items. GeoParquet files
+            are not loaded up front, only the row groups that can match the
+            search are read (see :meth:`ItemSearch.from_geoparquet`).
         ids: List of one or more Item ids to filter on.
         collections: List of one or more Collection IDs or :class:`pystac.Collection`
             instances. Only Items in one
@@ -179,9 +515,14 @@ class ItemSearch:
         if isinstance(
             catalog, (pystac.Catalog, pystac.Collection, pystac.ItemCollection)
         ):
-            self.df = to_geodataframe(catalog)
+            self.df = _cached_geodataframe(catalog)
+            self._path = None
+        elif isinstance(catalog, (str, os.PathLike)):
+            self.df = None
+            self._path = catalog
         else:
             self.df = catalog
+            self._path = None
 
         params = {
             "bbox": self._format_bbox(bbox),
@@ -196,6 +537,38 @@ class ItemSearch:
         self._parameters: dict[str, Any] = {
             k: v for k, v in params.items() if v is not None
         }
+        self._bbox_geom = None
+        if "bbox" in self._parameters:
+            self._bbox_geom = shapely.geometry.box(*self._parameters["bbox"])
+        self._intersects_geom = None
+        if isinstance(intersects, shapely.geometry.base.BaseGeometry):
+            self._intersects_geom = intersects
+        elif "intersects" in self._parameters:
+            self._intersects_geom = shapely.geometry.shape(
+                self._parameters["intersects"]
+            )
+
+    @classmethod
+    def from_geoparquet(cls, path: PathLike, **params) -> "ItemSearch":
+        """Search a GeoParquet file of STAC items without loading all of it.
+
+        ``ids``, ``collections`` and ``datetime`` (and ``bbox``/``intersects``
+        when the file has a GeoParquet ``bbox`` covering column) are pushed
+        down into the parquet scan, so the cost of ``result`` and
+        ``matched()`` scales with the number of matching row groups rather
+        than the size of the file.
+        """
+        return cls(path, **params)
+
+    @classmethod
+    def from_parquet(cls, path: PathLike, **params) -> "ItemSearch":
+        """Search a local GeoParquet file of STAC items in memory.
+
+        Unlike :meth:`from_geoparquet` the whole file is read (memory mapped),
+        and the geodataframe is reused by later calls until the file changes.
+        Prefer this when searching the same file repeatedly.
+        """
+        return cls(read_geoparquet_cached(path), **params)
 
     def _format_datetime(self, value: Optional[DatetimeLike]) -> Optional[Datetime]:
         """Convert input to a tuple of start and end pd.Timestamps.
@@ -206,6 +579,8 @@ class ItemSearch:
             return None
         elif isinstance(value, str):
             components = value.split("/")
+        elif isinstance(value, datetime_):
+            components = [value]
         else:
             components = list(value)  # type: ignore
 
@@ -213,19 +588,11 @@ class ItemSearch:
         if not components:
             return None
         elif len(components) == 1:
-            period = pd.Period(components[0])
-            start = period.start_time.tz_localize("utc")
-            end = period.end_time.tz_localize("utc")
-            return start, end
+            return _datetime_bounds(components)[0]
         elif len(components) == 2:
-            if components[0] in ["..", None]:
-                start = None
-            else:
-                start = pd.Period(components[0]).start_time.tz_localize("utc")
-            if components[1] in ["..", None]:
-                end = None
-            else:
-                end = pd.Period(components[1]).end_time.tz_localize("utc")
+            first, last = _datetime_bounds(components)
+            start = None if first is None else first[0]
+            end = None if last is None else last[1]
             return start, end
         else:
             raise Exception(
@@ -263,14 +630,19 @@ class ItemSearch:
 
     @staticmethod
     def _format_intersects(value: Optional[IntersectsLike]) -> Optional[Intersects]:
+        """Normalize ``intersects`` to a GeoJSON dict.
+
+        Dicts (and the output of ``__geo_interface__``) are not copied: the
+        returned mapping is shared with the caller and is never modified here.
+        """
         if value is None:
             return None
-        if isinstance(value, dict):
-            return deepcopy(value)
-        if isinstance(value, str):
+        elif isinstance(value, dict):
+            return value
+        elif isinstance(value, str):
             return dict(json.loads(value))
-        if hasattr(value, "__geo_interface__"):
-            return dict(deepcopy(getattr(value, "__geo_interface__")))
+        elif hasattr(value, "__geo_interface__"):
+            return dict(getattr(value, "__geo_interface__"))
         raise Exception(
             "intersects must be of type None, str, dict, or an object that "
             "implements __geo_interface__"
@@ -293,9 +665,66 @@ class ItemSearch:
         """Read-only view of parameters"""
         return self._parameters.copy()
 
+    @cached_property
+    def _compiled_filter(self) -> Optional[Compiled]:
+        """Compiled filter or None if no filter was provided"""
+        if "filter" not in self._parameters:
+            return None
+        return _compiled_filter(
+            self._parameters["filter"], self._parameters["filter-lang"]
+        )
+
+    @cached_property
+    def _sorted_datetimes(self) -> Optional[np.ndarray]:
+        """datetime column as datetime64[ns] if it is sorted, otherwise None"""
+        return _sorted_datetimes(self.df)
+
+    @cached_property
+    def _bounds(self) -> np.ndarray:
+        return _bounds(self.df)
+
+    @cached_property
+    def _mask(self) -> Optional[np.ndarray]:
+        sorted_datetimes = None
+        if "datetime" in self._parameters:
+            sorted_datetimes = self._sorted_datetimes
+        bounds = None
+        spatial = "bbox" in self._parameters or "intersects" in self._parameters
+        if spatial and not self.df.has_sindex and len(self.df) < SINDEX_MIN_ROWS:
+            bounds = self._bounds
+        return _search_mask(
+            self.df,
+            bounds=bounds,
+            compiled_filter=self._compiled_filter,
+            sorted_datetimes=sorted_datetimes,
+            bbox_geom=self._bbox_geom,
+            intersects_geom=self._intersects_geom,
+            **self.parameters,
+        )
+
     @cached_property
     def result(self) -> geopandas.GeoDataFrame:
-        return _search(self.df, **self.parameters)
+        if self._path is not None:
+            return self._search_geoparquet()
+        if self._mask is None:
+            return self.df.copy(deep=False)
+        return self.df.iloc[np.flatnonzero(self._mask)]
+
+    def _search_geoparquet(self) -> geopandas.GeoDataFrame:
+        filters = _parquet_filter(
+            pq.read_schema(self._path),
+            bbox_geom=self._bbox_geom,
+            intersects_geom=self._intersects_geom,
+            **self.parameters,
+        )
+        df = from_geoparquet(self._path, filters=filters)
+        return _search(
+            df,
+            compiled_filter=self._compiled_filter,
+            bbox_geom=self._bbox_geom,
+            intersects_geom=self._intersects_geom,
+            **self.parameters,
+        )
 
     def as_geodataframe(self):
         return self.result
@@ -308,17 +737,25 @@ class ItemSearch:
         Returns:
             int: Total count of matched items.
         """
-        return len(self.result)
+        if self._path is not None:
+            return len(self.result)
+        if self._mask is None:
+            return len(self.df)
+        return int(self._mask.sum())
 
     @cache
     def item_collection(self) -> pystac.ItemCollection:
         """
         Get the matching items as a :py:class:`pystac.ItemCollection`.
 
+        This is the slow path: every item is converted to a dict and then to
+        a :class:`pystac.Item` up front. Prefer :meth:`items` or
+        :meth:`items_as_dicts` when iterating.
+
         Return:
             ItemCollection: The item collection
         """
-        return stac_geoparquet.to_item_collection(self.result)
+        return pystac.ItemCollection(self.items())
 
     def items(self) -> Iterator[pystac.Item]:
         """Iterator that yields :class:`pystac.Item` instances for each item matching
@@ -327,7 +764,8 @@ class ItemSearch:
         Yields:
             Item : each Item matching the search criteria
         """
-        yield from self.item_collection()
+        for item in self.items_as_dicts():
+            yield pystac.Item.from_dict(item)
 
     def items_as_dicts(self) -> Iterator[dict[str, Any]]:
         """Iterator that yields :class:`dict` instances for each item matching
@@ -336,5 +774,4 @@ class ItemSearch:
         Yields:
             Item : each Item matching the search criteria
         """
-        for item in self.items():
-            yield item.to_dict()
+        yield from to_item_dicts(self.result)
@@ -1,38 +1,289 @@
 import functools
 import json
-from typing import Union
+import os
+import re
+import weakref
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from typing import Any, Optional, Union
 
 import geopandas
+import numpy as np
+import pandas as pd
+import pyarrow as pa
 import pystac
 import stac_geoparquet
 
+# ``stac_geoparquet.arrow`` exists from 0.5 but only handles pystac items
+# (and the items in the test data) from 0.8.
+ARROW_MIN_VERSION = (0, 8)
+
+try:
+    import stac_geoparquet.arrow as stac_arrow
+except ImportError:
+    stac_arrow = None
+
+
+def _version_at_least(version: str, minimum: tuple[int, ...]) -> bool:
+    """Whether the leading ``major.minor`` of ``version`` (which may have a
+    suffix like ``rc1``) is at least ``minimum``. False if it can't be read.
+    """
+    match = re.match(r"(\d+)\.(\d+)", version)
+    if match is None:
+        return False
+    return tuple(int(v) for v in match.groups()) >= minimum
+
+
+if stac_arrow is not None and not _version_at_least(
+    getattr(stac_geoparquet, "__version__", ""), ARROW_MIN_VERSION
+):
+    stac_arrow = None
+
+# ``id`` is only stored as a categorical when it repeats often enough for the
+# integer codes to pay for the categories themselves.
+CATEGORICAL_ID_RATIO = 0.5
+
+
+def _ensure_categorical(df: geopandas.GeoDataFrame) -> geopandas.GeoDataFrame:
+    """Store ``collection`` (and ``id`` when it is low-cardinality) as
+    categoricals so that membership tests compare integer codes rather than
+    hashing every string.
+
+    Modifies ``df`` in place and returns it.
+    """
+    if "collection" in df and not isinstance(
+        df["collection"].dtype, pd.CategoricalDtype
+    ):
+        df["collection"] = df["collection"].astype("category")
+
+    if "id" in df and not isinstance(df["id"].dtype, pd.CategoricalDtype):
+        if len(df) and df["id"].nunique() / len(df) < CATEGORICAL_ID_RATIO:
+            df["id"] = df["id"].astype("category")
+
+    return df
+
+
+def _bbox_struct_to_list(table: pa.Table) -> pa.Table:
+    """stac-geoparquet's Arrow schema stores ``bbox`` as a struct of
+    ``xmin, ymin, ...``. Convert it back to the list layout used by the STAC
+    JSON (and by the dict based conversion) so that items round-trip.
+    """
+    if "bbox" not in table.column_names or not pa.types.is_struct(table["bbox"].type):
+        return table
+
+    bbox = table["bbox"].combine_chunks()
+    n = bbox.type.num_fields
+    values = np.column_stack(
+        [bbox.field(i).to_numpy(zero_copy_only=False) for i in range(n)]
+    )
+    bbox_list = pa.FixedSizeListArray.from_arrays(pa.array(values.ravel()), n)
+    return table.set_column(table.column_names.index("bbox"), "bbox", bbox_list)
+
+
+def _items_to_geodataframe(
+    items: Iterable[pystac.Item], use_arrow: Optional[bool] = None
+) -> geopandas.GeoDataFrame:
+    """Convert items to a geodataframe.
+
+    By default the items are written straight into Arrow buffers by
+    stac-geoparquet when it is new enough to support that. Pass
+    ``use_arrow=False`` to go through a list of item dicts instead.
+    """
+    if use_arrow is None:
+        use_arrow = stac_arrow is not None
+
+    if use_arrow:
+        if stac_arrow is None:
+            raise ImportError("use_arrow=True requires stac-geoparquet>=0.8")
+        table = stac_arrow.parse_stac_items_to_arrow(items).read_all()
+        df = _drop_struct_nulls(
+            geopandas.GeoDataFrame.from_arrow(_bbox_struct_to_list(table))
+        )
+    else:
+        records = [item.to_dict() for item in items]
+        df = stac_geoparquet.to_geodataframe(records)
+
+    return _ensure_categorical(df)
+
 
 @functools.singledispatch
-def to_geodataframe(obj, **kwargs) -> geopandas.GeoDataFrame:
+def _to_geodataframe(obj, **kwargs) -> geopandas.GeoDataFrame:
     raise TypeError
 
 
-@to_geodataframe.register(pystac.Catalog)
-@to_geodataframe.register(pystac.Collection)
-def _(obj: Union[pystac.Catalog, pystac.Collection]) -> geopandas.GeoDataFrame:
-    records = [item.to_dict() for item in obj.get_items(recursive=True)]
-    return stac_geoparquet.to_geodataframe(records)
+@_to_geodataframe.register(pystac.Catalog)
+@_to_geodataframe.register(pystac.Collection)
+def _(
+    obj: Union[pystac.Catalog, pystac.Collection], use_arrow: Optional[bool] = None
+) -> geopandas.GeoDataFrame:
+    return _items_to_geodataframe(obj.get_items(recursive=True), use_arrow)
+
 
+@_to_geodataframe.register(pystac.ItemCollection)
+def _(obj: pystac.ItemCollection, use_arrow: Optional[bool] = None):
+    return _items_to_geodataframe(obj.items, use_arrow)
 
-@to_geodataframe.register(pystac.ItemCollection)
-def _(obj: pystac.ItemCollection):
-    records = obj.to_dict()["features"]
-    return stac_geoparquet.to_geodataframe(records)
+
+# Geodataframes built from STAC objects, keyed by the object and then by
+# ``use_arrow``. Entries go away when the STAC object is garbage collected.
+_df_cache: "weakref.WeakKeyDictionary[Any, dict]" = weakref.WeakKeyDictionary()
+
+
+def _cached_geodataframe(
+    obj, use_arrow: Optional[bool] = None
+) -> geopandas.GeoDataFrame:
+    """The cached geodataframe for a STAC object, building it if needed.
+
+    The same frame is returned every time, so it must not be modified.
+    """
+    try:
+        frames = _df_cache.setdefault(obj, {})
+    except TypeError:  # not weak-referenceable, let dispatch raise
+        return _to_geodataframe(obj, use_arrow=use_arrow)
+
+    if use_arrow not in frames:
+        frames[use_arrow] = _to_geodataframe(obj, use_arrow=use_arrow)
+    return frames[use_arrow]
+
+
+@functools.singledispatch
+def to_geodataframe(obj, use_arrow: Optional[bool] = None) -> geopandas.GeoDataFrame:
+    """Convert a pystac Catalog, Collection, or ItemCollection to a geodataframe.
+
+    The result is cached per object so converting (or searching) the same
+    catalog again is cheap. What is returned is a shallow copy of the cached
+    geodataframe: adding or replacing columns is fine, but modifying values
+    in place (or the asset dicts) changes them for later searches too. Call
+    ``to_geodataframe.cache_clear()`` if the catalog itself has changed.
+
+    This is a ``functools.singledispatch`` function, so converters for other
+    types can be added with ``to_geodataframe.register``.
+    """
+    return _cached_geodataframe(obj, use_arrow).copy(deep=False)
+
+
+to_geodataframe.cache_clear = _df_cache.clear  # type: ignore[attr-defined]
+
+
+def _format_datetimes(datetimes: pd.Series) -> pd.Series:
+    """Format datetimes as RFC 3339 strings in UTC, with None for NaT.
+    Naive datetimes are taken to be in UTC already.
+    """
+    if datetimes.dt.tz is not None:
+        datetimes = datetimes.dt.tz_convert("UTC")
+    return datetimes.dt.strftime("%Y-%m-%dT%H:%M:%S.%fZ").fillna("").replace({"": None})
+
+
+def to_item_dicts(df: geopandas.GeoDataFrame) -> Iterator[dict[str, Any]]:
+    """Yield a STAC item dict for each row of ``df`` without building
+    intermediate :class:`pystac.Item` objects.
+    """
+    datelike = df.select_dtypes(include=["datetime", "datetimetz"]).columns
+    if len(datelike):
+        df = df.assign(**{k: _format_datetimes(df[k]) for k in datelike})
+    for record in df.to_dict(orient="records"):
+        item = stac_geoparquet.to_dict(record)
+        item["properties"] = _to_json(item["properties"])
+        for k in ["assets", "links"]:
+            if k in item:
+                item[k] = _to_json(item[k])
+        yield item
+
+
+def _to_json(value: Any, drop_none: bool = False) -> Any:
+    """Convert numpy arrays nested anywhere in ``value`` to lists.
+
+    With ``drop_none``, None values are removed from dicts as well.
+    """
+    if isinstance(value, np.ndarray):
+        value = value.tolist()
+    if isinstance(value, dict):
+        return {
+            k: _to_json(v, drop_none)
+            for k, v in value.items()
+            if not (drop_none and v is None)
+        }
+    if isinstance(value, list):
+        return [_to_json(v, drop_none) for v in value]
+    return value
+
+
+# Columns that may be stored as Arrow structs, where every row gets every
+# field that any row has (with nulls, and ints widened to floats when some
+# rows are missing them).
+STRUCT_COLUMNS = ["assets", "links"]
+
+
+def _drop_struct_nulls(
+    df: geopandas.GeoDataFrame, columns: Iterable[str] = STRUCT_COLUMNS
+) -> geopandas.GeoDataFrame:
+    """Remove the None fields that Arrow structs add to ``columns`` (such as
+    ``assets`` and ``links``) for items that didn't have them. Fields that
+    really were null can't be told apart from these, so they are removed as
+    well.
+
+    Modifies ``df`` in place and returns it.
+    """
+    for k in columns:
+        if k in df:
+            df[k] = df[k].map(functools.partial(_to_json, drop_none=True))
+    return df
 
 
 def to_geoparquet(df: geopandas.GeoDataFrame, path: str) -> None:
+    """Write a geodataframe of STAC items to a GeoParquet file.
+
+    ``assets`` are written as JSON strings so that they read back exactly
+    as they were; as a struct column their fields would be padded with nulls
+    and widened. ``links`` are written natively as a list of structs.
+    """
     df2 = df.copy()
-    df2.assets = df2.assets.apply(json.dumps)
+    df2.assets = df2.assets.map(lambda value: json.dumps(_to_json(value)))
     df2.to_parquet(path)
     return
 
 
-def from_geoparquet(path: str) -> str:
-    df = geopandas.read_parquet(path)
-    df.assets = df.assets.apply(json.loads)
-    return df
+def from_geoparquet(path: str, **kwargs) -> geopandas.GeoDataFrame:
+    """Read a GeoParquet file of STAC items, for instance one written by
+    ``to_geoparquet``. Extra keyword arguments (such as ``filters``) are
+    passed on to ``geopandas.read_parquet``.
+    """
+    df = geopandas.read_parquet(path, **kwargs)
+    if not len(df):
+        return df
+    structs = [k for k in STRUCT_COLUMNS if k in df]
+    if "assets" in df and isinstance(df.assets.iloc[0], str):
+        df.assets = df.assets.map(json.loads)
+        structs.remove("assets")
+    return _drop_struct_nulls(df, structs)
+
+
+# How many files ``read_geoparquet_cached`` keeps in memory at once.
+PARQUET_CACHE_SIZE = 8
+
+# Geodataframes read by ``read_geoparquet_cached`` keyed by absolute path,
+# along with the modification time of the file when it was read. Least
+# recently used first.
+_parquet_cache: "OrderedDict[str, tuple[int, geopandas.GeoDataFrame]]" = OrderedDict()
+
+
+def read_geoparquet_cached(path: str) -> geopandas.GeoDataFrame:
+    """Memory map and read a local GeoParquet file of STAC items, reusing the
+    geodataframe from the last read if the file hasn't been modified since.
+
+    The last ``PARQUET_CACHE_SIZE`` files are kept; call
+    ``read_geoparquet_cached.cache_clear()`` to release them all.
+    """
+    path = os.path.abspath(path)
+    mtime = os.stat(path).st_mtime_ns
+    cached = _parquet_cache.get(path)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, from_geoparquet(path, memory_map=True))
+    _parquet_cache[path] = cached
+    _parquet_cache.move_to_end(path)
+    while len(_parquet_cache) > PARQUET_CACHE_SIZE:
+        _parquet_cache.popitem(last=False)
+    return cached[1]
+
+
+read_geoparquet_cached.cache_clear = _parquet_cache.clear  # type: ignore[attr-defined]
@@ -0,0 +1,121 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pygeofilter.backends.geopandas.evaluate import to_filter
+from pygeofilter.parsers import cql2_text
+
+from stac_static import cql2
+from stac_static.cql2 import FUNCTION_MAP, compile_ast
+from stac_static.utils import to_geodataframe
+
+
+@pytest.fixture(scope="module")
+def df(planet_disaster):
+    return to_geodataframe(planet_disaster)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "eo:cloud_cover < 10",
+        "10 > eo:cloud_cover",
+        "eo:cloud_cover < 10 AND view:sun_elevation > 60",
+        "eo:cloud_cover >= 10 OR platform = 'SS02'",
+        "NOT (platform = 'SS02')",
+        "gsd BETWEEN 1 AND 3",
+        "gsd NOT BETWEEN 1 AND 3",
+        "platform IN ('SS02', 'SSC1d1')",
+        "eo:cloud_cover IN (0, 1)",
+        "id LIKE '%SS02'",
+        "id NOT LIKE '%SS02'",
+        "collection = 'planet-disaster-data'",
+        "gsd * 2 > 5",
+        "NOT (view:azimuth < 200)",
+        "S_INTERSECTS(geometry, POINT(-95.6 29.8))",
+        "eo:cloud_cover < 10 AND S_INTERSECTS(geometry, POINT(-95.6 29.8))",
+    ],
+)
+def test_compile_ast_matches_pygeofilter(df, text):
+    ast = cql2_text.parse(text)
+    expected = to_filter(df, ast, {}, FUNCTION_MAP).to_numpy(dtype=bool)
+    result = compile_ast(ast)(df)
+    assert result.dtype == bool
+    np.testing.assert_array_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "collection > 'area-1-1'",
+        "collection <= 'area-1-1'",
+        "collection BETWEEN 'area-1-2' AND 'area-2-1'",
+        "collection = 'area-1-1'",
+    ],
+)
+def test_ordering_on_categoricals(test_case_1, text):
+    df = test_case_1
+    if not isinstance(df, pd.DataFrame):
+        df = to_geodataframe(df)
+    assert isinstance(df["collection"].dtype, pd.CategoricalDtype)
+    decoded = df.assign(collection=df["collection"].astype(str))
+
+    ast = cql2_text.parse(text)
+    expected = to_filter(decoded, ast, {}, FUNCTION_MAP).to_numpy(dtype=bool)
+    assert expected.any()
+    np.testing.assert_array_equal(compile_ast(ast)(df), expected)
+
+
+def test_compile_ast_is_null(df):
+    ast = cql2_text.parse("pl:provider IS NULL")
+    expected = df["pl:provider"].isna().to_numpy()
+    np.testing.assert_array_equal(compile_ast(ast)(df), expected)
+
+
+def test_numeric_filters_share_a_kernel(df):
+    pytest.importorskip("numba")
+    from stac_static.cql2 import _compile_kernel, _jit
+
+    first = _compile_kernel(cql2_text.parse("eo:cloud_cover < 10 AND gsd > 1"))
+    second = _compile_kernel(cql2_text.parse("eo:cloud_cover < 5 AND gsd > 2"))
+
+    np.testing.assert_array_equal(
+        first(df), ((df["eo:cloud_cover"] < 10) & (df["gsd"] > 1)).to_numpy()
+    )
+    hits = _jit.cache_info().hits
+    np.testing.assert_array_equal(
+        second(df), ((df["eo:cloud_cover"] < 5) & (df["gsd"] > 2)).to_numpy()
+    )
+    assert _jit.cache_info().hits == hits + 1
+    assert _compile_kernel(cql2_text.parse("platform = 'SS02'")) is None
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "eo:cloud_cover < 10",
+        "eo:cloud_cover < 10 AND view:sun_elevation > 60",
+        "eo:cloud_cover >= 10 OR gsd <= 3",
+        "NOT (view:azimuth < 200)",
+        "gsd NOT BETWEEN 1 AND 3",
+        "gsd * 2 > 5",
+    ],
+)
+def test_kernel_matches_pygeofilter(df, monkeypatch, text):
+    pytest.importorskip("numba")
+    monkeypatch.setattr(cql2, "KERNEL_MIN_ROWS", 0)
+    ast = cql2_text.parse(text)
+    assert cql2._compile_kernel(ast)(df) is not None
+    expected = to_filter(df, ast, {}, FUNCTION_MAP).to_numpy(dtype=bool)
+    np.testing.assert_array_equal(compile_ast(ast)(df), expected)
+
+
+def test_small_frames_skip_the_kernel(df, monkeypatch):
+    monkeypatch.setattr(cql2, "_compile_kernel", lambda root: lambda df: 1 / 0)
+    monkeypatch.setattr(cql2, "HAS_NUMBA", True)
+    compiled = compile_ast(cql2_text.parse("eo:cloud_cover < 10"))
+    expected = (df["eo:cloud_cover"] < 10).to_numpy()
+    np.testing.assert_array_equal(compiled(df), expected)
+
+    monkeypatch.setattr(cql2, "KERNEL_MIN_ROWS", 0)
+    with pytest.raises(ZeroDivisionError):
+        compiled(df)
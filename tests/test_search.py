@@ -1,9 +1,28 @@
+import copy
+import importlib
 import json
+import os
 
 import pandas as pd
+import pyarrow as pa
 import pytest
+import shapely
 
-from stac_static import search
+from stac_static import search, utils
+from stac_static.search import (
+    ItemSearch,
+    _filter_expr,
+    _parse_filter,
+    _search,
+    _search_mask,
+)
+from stac_static.utils import (
+    from_geoparquet,
+    read_geoparquet_cached,
+    to_geodataframe,
+    to_geoparquet,
+    to_item_dicts,
+)
 
 GEOJSON = """{
   "type": "Polygon",
@@ -31,6 +50,7 @@ def test_collections(test_case_1):
     df = result.as_geodataframe()
     assert len(df) == 2
     assert df.collection.unique().tolist() == ["area-1-1"]
+    assert isinstance(df.collection.dtype, pd.CategoricalDtype)
 
 
 def test_bbox(test_case_1):
@@ -39,12 +59,36 @@ def test_bbox(test_case_1):
     assert result.matched() == 8
 
 
-def test_intersects(test_case_1):
-    intersects = GEOJSON
+@pytest.mark.parametrize(
+    "intersects",
+    [GEOJSON, json.loads(GEOJSON), shapely.geometry.shape(json.loads(GEOJSON))],
+)
+def test_intersects(test_case_1, intersects):
     result = search(test_case_1, intersects=intersects)
+    assert result.parameters["intersects"]["type"] == "Polygon"
     assert result.matched() == 8
 
 
+@pytest.mark.parametrize("use_sindex", [False, True])
+def test_bbox_uses_geometry_not_bounds(planet_disaster, use_sindex):
+    df = to_geodataframe(planet_disaster)
+    triangle = shapely.geometry.Polygon([(-10, -10), (10, -10), (-10, 10)])
+    df = df.set_geometry([triangle] * len(df), crs=df.crs)
+    if use_sindex:
+        df.sindex
+    # within the triangle's bounds but not the triangle
+    assert search(df, bbox=[5, 5, 6, 6]).matched() == 0
+    assert search(df, bbox=[-6, -6, -5, -5]).matched() == len(df)
+
+
+def test_bbox_and_intersects(test_case_1):
+    result = search(test_case_1, bbox=[-4, 3, -1, 4], intersects=GEOJSON)
+    assert result.matched() == 8
+
+    result = search(test_case_1, bbox=[10, 10, 11, 11], intersects=GEOJSON)
+    assert result.matched() == 0
+
+
 @pytest.mark.parametrize(
     "filter,n",
     [
@@ -73,6 +117,21 @@ def test_filter(test_case_1, filter, n):
         ),
         ("../2022-03", None, pd.Timestamp("2022-03-31T23:59:59.999999999", tz="utc")),
         ("2022-03/..", pd.Timestamp("2022-03-01T00:00:00", tz="utc"), None),
+        (
+            "2022-03-05T10:15:30+02:00",
+            pd.Timestamp("2022-03-05T08:15:30", tz="utc"),
+            pd.Timestamp("2022-03-05T08:15:30.999999999", tz="utc"),
+        ),
+        (
+            "2022-03-05t10:15:30.5z",
+            pd.Timestamp("2022-03-05T10:15:30.5", tz="utc"),
+            pd.Timestamp("2022-03-05T10:15:30.500999999", tz="utc"),
+        ),
+        (
+            pd.Timestamp("2022-03-05T10:15:30"),
+            pd.Timestamp("2022-03-05T10:15:30", tz="utc"),
+            pd.Timestamp("2022-03-05T10:15:30", tz="utc"),
+        ),
     ],
 )
 def test_datetime_params(value, start, end, planet_disaster):
@@ -80,6 +139,283 @@ def test_datetime_params(value, start, end, planet_disaster):
     assert result._parameters["datetime"] == (start, end)
 
 
+def test_datetime_params_invalid(planet_disaster):
+    with pytest.raises(ValueError, match="invalid datetime"):
+        search(planet_disaster, datetime="20170610")
+
+
+@pytest.mark.parametrize(
+    "value,n",
+    [("2017-08-31", 5), ("2016", 0), ("2017-08-31T17:00:00Z/..", 4)],
+)
+def test_datetime(value, n, planet_disaster):
+    result = search(planet_disaster, datetime=value)
+    assert result._sorted_datetimes is None
+    assert result.matched() == n
+    assert len(result.as_geodataframe()) == n
+
+    df = to_geodataframe(planet_disaster).sort_values("datetime")
+    result = search(df, datetime=value)
+    assert result._sorted_datetimes is not None
+    assert result.matched() == n
+    assert len(result.as_geodataframe()) == n
+
+
+def test_to_geodataframe_register(planet_disaster):
+    class Wrapper:
+        def __init__(self, catalog):
+            self.catalog = catalog
+
+    @to_geodataframe.register(Wrapper)
+    def _(obj, **kwargs):
+        return to_geodataframe(obj.catalog, **kwargs)
+
+    df = to_geodataframe(Wrapper(planet_disaster))
+    assert len(df) == 5
+    with pytest.raises(TypeError):
+        to_geodataframe(object())
+
+
+@pytest.mark.parametrize(
+    "dtype", [None, object, pd.ArrowDtype(pa.timestamp("ns", tz="UTC"))]
+)
+def test_sorted_datetimes_dtypes(planet_disaster, dtype):
+    value = "2017-08-31T17:00:00Z/.."
+    df = to_geodataframe(planet_disaster).sort_values("datetime")
+    if dtype is not None:
+        df["datetime"] = df["datetime"].astype(dtype)
+    result = search(df, datetime=value)
+    assert (result._sorted_datetimes is None) == (dtype is not None)
+    assert result.matched() == 4
+
+
+def test_sorted_datetimes_in_place_edit(planet_disaster):
+    df = to_geodataframe(planet_disaster).sort_values("datetime")
+    assert search(df, datetime="2017-09").matched() == 0
+    df["datetime"].array[2] = pd.Timestamp("2017-09-05", tz="utc")
+    result = search(df, datetime="2017-09")
+    assert result._sorted_datetimes is None
+    assert result.matched() == 1
+
+
 def test_item_collection_eo(item_collection):
     result = search(item_collection, filter="eo:cloud_cover < 10")
     assert result.matched() == 4
+
+
+def test_filter_only_sees_remaining_rows(planet_disaster):
+    df = to_geodataframe(planet_disaster)
+    seen = []
+
+    def compiled_filter(df):
+        seen.append(len(df))
+        return (df["eo:cloud_cover"] < 10).to_numpy()
+
+    mask = _search_mask(
+        df,
+        compiled_filter=compiled_filter,
+        ids=(df["id"].iloc[0],),
+        filter="eo:cloud_cover < 10",
+    )
+    assert seen == [1]
+    assert mask.sum() == (df["eo:cloud_cover"].iloc[0] < 10)
+
+
+def test_filter_ast_is_cached(test_case_1):
+    _filter = {"op": "like", "args": [{"property": "id"}, "%labels"]}
+    first = search(test_case_1, filter=_filter)
+    second = search(test_case_1, filter=dict(reversed(_filter.items())))
+    assert first._compiled_filter is second._compiled_filter
+
+    misses = _parse_filter.cache_info().misses
+    _parse_filter("cql2-json", _filter_expr(_filter))
+    assert _parse_filter.cache_info().misses == misses
+    assert first.matched() == second.matched() == 4
+
+
+def test_item_collection_round_trip(planet_disaster):
+    expected = {
+        item.id: item.bbox for item in planet_disaster.get_items(recursive=True)
+    }
+    result = search(planet_disaster)
+    items = list(result.item_collection())
+    assert {item.id: item.bbox for item in items} == expected
+
+
+def test_to_geodataframe_use_arrow(planet_disaster):
+    if utils.stac_arrow is None:
+        pytest.skip("stac-geoparquet is too old for the Arrow path")
+    expected = {
+        item.id: item.bbox for item in planet_disaster.get_items(recursive=True)
+    }
+    df = to_geodataframe(planet_disaster, use_arrow=True)
+    assert {item["id"]: item["bbox"] for item in to_item_dicts(df)} == expected
+    assert search(df, bbox=[-96, 29, -95, 30]).matched() == 4
+
+
+def test_geodataframe_is_cached(planet_disaster):
+    first = search(planet_disaster, filter="eo:cloud_cover < 10")
+    second = search(planet_disaster, datetime="2017")
+    assert first.df is second.df
+
+    to_geodataframe.cache_clear()
+    assert search(planet_disaster).df is not first.df
+
+
+@pytest.mark.parametrize(
+    "params,n",
+    [
+        ({}, 5),
+        ({"ids": "20170831_172754_101c"}, 1),
+        ({"collections": "planet-disaster-data"}, 5),
+        ({"datetime": "2017-08-31T17:00:00Z/.."}, 4),
+        ({"filter": "eo:cloud_cover < 10"}, 4),
+        ({"bbox": [-96, 29, -95, 30]}, 4),
+    ],
+)
+def test_geoparquet(planet_disaster, tmp_path, params, n):
+    path = tmp_path / "items.parquet"
+    to_geoparquet(to_geodataframe(planet_disaster), path)
+
+    result = ItemSearch.from_geoparquet(path, **params)
+    assert result.matched() == search(planet_disaster, **params).matched() == n
+    assert all(isinstance(assets, dict) for assets in result.result.assets)
+
+
+def test_geoparquet_datetime_pushdown_keeps_nanoseconds(planet_disaster, tmp_path):
+    df = to_geodataframe(planet_disaster)
+    df["datetime"] = pd.Timestamp("2017-08-31T23:59:59.9999995", tz="utc")
+    path = tmp_path / "items.parquet"
+    to_geoparquet(df, path)
+    assert search(path, datetime="2017-08-31").matched() == len(df)
+
+
+def test_items_as_dicts(planet_disaster):
+    result = search(planet_disaster, filter="eo:cloud_cover < 10")
+    dicts = list(result.items_as_dicts())
+    assert [d["id"] for d in dicts] == [item.id for item in result.items()]
+    assert [d["id"] for d in dicts] == [item.id for item in result.item_collection()]
+    assert all(isinstance(d["properties"]["datetime"], str) for d in dicts)
+    json.dumps(dicts)
+
+
+def test_items_as_dicts_converts_to_utc(planet_disaster):
+    df = to_geodataframe(planet_disaster)
+    expected = [d["properties"]["datetime"] for d in to_item_dicts(df)]
+    eastern = df.assign(datetime=df["datetime"].dt.tz_convert("US/Eastern"))
+    assert [d["properties"]["datetime"] for d in to_item_dicts(eastern)] == expected
+
+
+def test_no_parameters_returns_catalog(planet_disaster):
+    result = search(planet_disaster)
+    assert result.matched() == 5
+    df = result.as_geodataframe()
+    assert df is not result.df
+    assert df.index.equals(result.df.index)
+
+    df["id"] = "changed"
+    assert search(planet_disaster).as_geodataframe()["id"].iloc[0] != "changed"
+    assert to_geodataframe(planet_disaster)["id"].iloc[0] != "changed"
+
+
+def test_geoparquet_round_trip(planet_disaster, test_case_1, tmp_path):
+    for catalog in [planet_disaster, test_case_1]:
+        df = catalog if isinstance(catalog, pd.DataFrame) else to_geodataframe(catalog)
+        # an int field only some assets have and a field that is really null
+        df = df.assign(assets=[copy.deepcopy(assets) for assets in df.assets])
+        asset = next(iter(df.assets.iloc[0].values()))
+        asset["file:size"] = 3
+        asset["title"] = None
+
+        path = tmp_path / "items.parquet"
+        to_geoparquet(df, path)
+
+        df2 = from_geoparquet(path)
+        assert all(isinstance(assets, dict) for assets in df2.assets)
+        for item, expected in zip(to_item_dicts(df2), to_item_dicts(df)):
+            assert item["id"] == expected["id"]
+            assert json.dumps(item["assets"]) == json.dumps(expected["assets"])
+            assert json.dumps(item["links"]) == json.dumps(expected["links"])
+        asset = next(iter(next(to_item_dicts(df2))["assets"].values()))
+        assert type(asset["file:size"]) is int
+        assert asset["title"] is None
+
+
+def test_from_parquet_is_cached(planet_disaster, tmp_path):
+    path = tmp_path / "items.parquet"
+    to_geoparquet(to_geodataframe(planet_disaster), path)
+
+    first = ItemSearch.from_parquet(path, filter="eo:cloud_cover < 10")
+    second = ItemSearch.from_parquet(str(path), datetime="2017")
+    assert first.df is second.df
+    assert first.matched() == 4
+    assert second.matched() == 5
+
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert ItemSearch.from_parquet(path).df is not first.df
+
+    read_geoparquet_cached.cache_clear()
+    assert ItemSearch.from_parquet(path).df is not second.df
+
+
+class ReadOnlyDict(dict):
+    def __setitem__(self, key, value):
+        raise AssertionError("intersects should not be modified")
+
+
+def test_intersects_is_not_copied(test_case_1):
+    intersects = ReadOnlyDict(json.loads(GEOJSON))
+    result = search(test_case_1, intersects=intersects)
+    assert result._parameters["intersects"] is intersects
+    assert result.matched() == 8
+
+
+def test_intersects_is_parsed_once(test_case_1, monkeypatch):
+    calls = []
+    loads = json.loads
+    monkeypatch.setattr(json, "loads", lambda s: calls.append(s) or loads(s))
+    result = search(test_case_1, intersects=GEOJSON)
+    assert calls == [GEOJSON]
+    assert result.matched() == 8
+
+
+def test_search_accepts_lists(test_case_1):
+    df = search(test_case_1).df
+    ids = list(df["id"].iloc[:2])
+    assert len(_search(df, ids=ids)) == 2
+
+
+def test_geometries_are_built_once(test_case_1):
+    result = search(test_case_1, bbox=[-4, 3, -1, 4])
+    assert result._bbox_geom.equals(shapely.geometry.box(-4, 3, -1, 4))
+    assert result.matched() == 8
+
+    # _search uses the geometry it is given over the raw parameter
+    elsewhere = shapely.geometry.box(0, 0, 1, 1)
+    assert len(_search(result.df, bbox_geom=elsewhere, **result.parameters)) == 0
+
+
+@pytest.mark.parametrize("use_sindex", [True, False])
+def test_parallel_refinement(planet_disaster, monkeypatch, use_sindex):
+    df = to_geodataframe(planet_disaster)
+    if use_sindex:
+        df.sindex
+    houston = shapely.geometry.box(-96, 29, -95, 30)
+    expected = search(df, intersects=houston).matched()
+    assert expected > 0
+
+    module = importlib.import_module(ItemSearch.__module__)
+    monkeypatch.setattr(module, "PARALLEL_MIN_CANDIDATES", 1)
+    monkeypatch.setattr("os.cpu_count", lambda: 4)
+    assert search(df, intersects=houston).matched() == expected
+    assert not shapely.is_prepared(houston)
+
+
+@pytest.mark.parametrize(
+    "version,expected",
+    [("0.8.2", True), ("0.9rc1", True), ("1.0.0.dev3", True), ("0.6.0", False)],
+)
+def test_arrow_version_check(version, expected):
+    assert utils._version_at_least(version, utils.ARROW_MIN_VERSION) is expected
+    assert utils._version_at_least("unknown", utils.ARROW_MIN_VERSION) is False